@@ -1,11 +1,20 @@
 import json
 import time
 import logging
+from dataclasses import dataclass
 from scraper import scrape_tracks, scrape_track_details
 from utils import save_json_to_tmp, save_to_db
 
 logger = logging.getLogger("lambda_function")
 
+@dataclass(slots=True)
+class TrackRow:
+    """One enriched track; slotted to keep per-row memory low. Serialized by utils.save_json_to_tmp."""
+    list_name: str
+    link: str
+    details: dict
+    list_snippet: str | None = None
+
 def lambda_handler(event, context):
     """
     New handler: scrape all tracks from the LiveRC landing page and fetch details.
@@ -34,8 +43,8 @@ def lambda_handler(event, context):
         logger.exception("scrape_tracks failed")
         return {"status": "error", "message": f"scrape_tracks failed: {e}"}
 
-    enriched = []
     total = len(tracks)
+    enriched = [None] * total
     imported_count = 0
     # process tracks with running tally
     for idx, t in enumerate(tracks, start=1):
@@ -50,8 +59,7 @@ def lambda_handler(event, context):
         except Exception:
             logger.exception("Failed to fetch details for %s", link)
             details = {}
-        merged = {"list_name": t.get("name"), "list_snippet": t.get("snippet"), "link": link, "details": details}
-        enriched.append(merged)
+        enriched[idx - 1] = TrackRow(list_name=t.get("name"), list_snippet=t.get("snippet"), link=link, details=details)
 
         # log running tally
         logger.info("Import progress: %d imported / %d processed / %d total", imported_count, idx, total)
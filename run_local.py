@@ -23,6 +23,12 @@ import json
 import logging
 import sys
 
+# orjson is faster; stdlib json is the fallback, as in scraper.scrape()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def parse_args():
     p = argparse.ArgumentParser(description="Run petitrc setupsheet scraper locally")
@@ -67,7 +73,10 @@ def main():
         print(str(e), file=sys.stderr)
         sys.exit(3)
 
-    print(json.dumps(res, indent=2, ensure_ascii=False))
+    if orjson is not None:
+        print(orjson.dumps(res, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
+    else:
+        print(json.dumps(res, indent=2, ensure_ascii=False))
 
 
 if __name__ == "__main__":
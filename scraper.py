@@ -1,6 +1,12 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from urllib.parse import urljoin
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
 import logging
 import re
 import json
@@ -9,19 +15,95 @@ import os
 
 logger = logging.getLogger("scraper")
 
+# prefer the C-backed lxml parser; fall back to the stdlib parser if lxml isn't installed
+try:
+    import lxml  # only probed here, BeautifulSoup loads it by name
+    _PARSER = "lxml"
+except ImportError:
+    _PARSER = "html.parser"
+
+# selectolax (Lexbor) is optional; it parses asset-only pages (per-driver setup pages) much faster than BS4
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# orjson serializes the (potentially large) result much faster; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# set to False to force the BeautifulSoup path if a page breaks under selectolax
+USE_SELECTOLAX = LexborHTMLParser is not None
+
 # maximum number of vehicle pages to fetch setups for per brand
 MAX_VEHICLE_SETUP_FETCH = 20
 
+# maximum number of page fetches in flight at once across all worker threads (politeness cap)
+MAX_CONCURRENT_FETCHES = 8
+_FETCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
+
+# maximum decoded body size read from any single page (2 MB); larger responses are truncated before parsing
+MAX_RESPONSE_BYTES = 2_000_000
+
+# precompiled regexes for the per-element loops
+_SIZE_RE = re.compile(r"\b(1[:/]\d|1/\d|1:\d)\b")  # scale like 1/10 or 1:8
+_PDF_RE = re.compile(r"\.pdf($|\?)", re.I)
+_IMG_RE = re.compile(r"\.(jpe?g|png|gif|bmp)($|\?)", re.I)
+_DIGITS_RE = re.compile(r"\D")  # non-digits, stripped from <font size="...">
+_WS_RE = re.compile(r"\s+")
+_VEHICLE_SETUP_RE = re.compile(r"vehicle.*setup|setup.*vehicle", re.I | re.S)
+
+# precompiled CSS selector for the in-page brand anchors of the alphabetical block
+_SEL_HASH_ANCHORS = sv.compile("a[href^='#']")
+
+# default for the optional `bq` argument: distinguishes "not looked up" from a looked-up None
+_MISSING = object()
+
+# shared session so every page fetch reuses pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; setuprc-scraper/1.0)",
+    "Accept": "text/html",
+    "Connection": "keep-alive",
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+def _fetch_html(url, timeout=10):
+    """GET url and return the decoded body bytes (at most MAX_RESPONSE_BYTES)."""
+    # stream the body and stop at MAX_RESPONSE_BYTES so a runaway page can't exhaust memory or parse time
+    with _FETCH_SLOTS, _SESSION.get(url, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        data = resp.raw.read(MAX_RESPONSE_BYTES, decode_content=True)
+        logger.debug("GET %s -> %d bytes, Content-Encoding=%s", url, len(data), resp.headers.get("Content-Encoding", "identity"))
+    if len(data) >= MAX_RESPONSE_BYTES:
+        logger.warning("Response from %s truncated at %d bytes", url, MAX_RESPONSE_BYTES)
+    return data
+
 def _get_soup(url, timeout=10):
-    resp = requests.get(url, timeout=timeout)
-    resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    # pass bytes so lxml detects the encoding itself instead of requests decoding to str first
+    return BeautifulSoup(_fetch_html(url, timeout=timeout), _PARSER)
 
 def _ensure_abs_url(href, base_url):
     """Normalize URLs like //host..., /path or relative into an absolute https URL."""
     if not href:
         return ""
     href = href.strip()
+    # already absolute: skip urljoin (and the cache lookup) for the common case
+    if href.startswith(("http://", "https://")):
+        return href
+    return _ensure_abs_url_cached(href, base_url)
+
+@lru_cache(maxsize=8192)
+def _ensure_abs_url_cached(href, base_url):
+    """Memoized core of _ensure_abs_url; expects an already-stripped href."""
     if href.startswith("//"):
         return "https:" + href
     return urljoin(base_url, href)
@@ -33,7 +115,7 @@ def _extract_vehicle_types(soup):
         if i and i.string:
             txt = i.get_text(separator=" ", strip=True)
             # heuristic: contains a size like 1/10 or 1:10 and keywords
-            if re.search(r"\b(1[:/]\d|1/\d|1:\d)\b", txt) or any(k in txt.lower() for k in ("electric","on-road","off-road","truck","pan car")):
+            if _SIZE_RE.search(txt) or any(k in txt.lower() for k in ("electric","on-road","off-road","truck","pan car")):
                 types.add(txt)
     return sorted(types)
 
@@ -53,12 +135,9 @@ def _find_vehicle_blockquote(soup):
         if bq:
             return bq
 
-    # fallback: find element whose text contains 'Vehicle Setups' (case-insensitive)
-    txt_tag = None
-    for tag in soup.find_all(text=True):
-        if "vehicle" in tag.lower() and "setup" in tag.lower():
-            txt_tag = tag
-            break
+    # fallback: find element whose text contains 'Vehicle Setups' (case-insensitive); find() stops
+    # at the first matching string instead of materializing every text node in the document
+    txt_tag = soup.find(string=_VEHICLE_SETUP_RE)
     if txt_tag:
         parent = getattr(txt_tag, "parent", None)
         if parent:
@@ -68,22 +147,24 @@ def _find_vehicle_blockquote(soup):
 
     # final fallback: first blockquote that contains at least one anchor with href starting '#'
     for bq in soup.find_all("blockquote"):
-        if bq.select("a[href^='#']"):
+        if _SEL_HASH_ANCHORS.select_one(bq):
             return bq
 
     return None
 
-def _extract_alphabet_brands(soup):
+def _extract_alphabet_brands(soup, bq=_MISSING):
     """
     Parse the alphabetical block adjacent to the Vehicle header to discover brand anchors.
     Returns a dict mapping anchor-id -> display name.
+    Pass `bq` (even None) when the Vehicle blockquote has already been looked up to skip the lookup.
     """
     out = {}
-    bq = _find_vehicle_blockquote(soup)
+    if bq is _MISSING:
+        bq = _find_vehicle_blockquote(soup)
     if not bq:
         return out
 
-    for a in bq.select("a[href^='#']"):
+    for a in _SEL_HASH_ANCHORS.select(bq):
         href = (a.get("href") or "").strip()
         if not href:
             continue
@@ -93,16 +174,17 @@ def _extract_alphabet_brands(soup):
             out[bid] = name
     return out  # id -> name
 
-def _extract_alphabet_order(soup):
+def _extract_alphabet_order(soup, bq=_MISSING):
     """
     Return the ordered list of anchor ids from the Vehicle alphabetical block,
     preserving the page order (A..Z and '#' if present).
     """
-    bq = _find_vehicle_blockquote(soup)
+    if bq is _MISSING:
+        bq = _find_vehicle_blockquote(soup)
     if not bq:
         return []
     out = []
-    for a in bq.select("a[href^='#']"):
+    for a in _SEL_HASH_ANCHORS.select(bq):
         href = (a.get("href") or "").strip()
         if not href:
             continue
@@ -111,23 +193,28 @@ def _extract_alphabet_order(soup):
             out.append(bid)
     return out
 
-def _collect_trs(soup):
+def _collect_trs(soup, bq=_MISSING):
     """
     Return all <tr> rows in the document.
 
     Rationale:
     - Some pages place brand rows outside of the largest/most "scored" table.
     - Simpler and more robust to query the whole document for <tr> rows and process them in order.
-    - For debugging, write the nearest vehicle table (if found) or the full document to a temp file.
+    - For debugging (DEBUG logging and PETITRC_DUMP_HTML=1), write the nearest vehicle table (if found)
+      or the full document to a temp file.
     """
     trs = soup.find_all("tr")
     logger.info("Collecting all <tr> from document: found %d rows", len(trs))
 
-    # Debug: try to write the main vehicle table (or the full document) to a temp file for inspection
+    # Debug: optionally write the main vehicle table (or the full document) to a temp file for inspection.
+    # Off by default: serializing the page and writing it out costs a full document walk plus disk I/O.
+    if not (logger.isEnabledFor(logging.DEBUG) and os.environ.get("PETITRC_DUMP_HTML")):
+        return trs
     try:
         # prefer the table immediately after the Vehicle alphabetical blockquote or Vehicle header
         tbl = None
-        bq = _find_vehicle_blockquote(soup)
+        if bq is _MISSING:
+            bq = _find_vehicle_blockquote(soup)
         if bq:
             tbl = bq.find_next("table")
         if tbl is None:
@@ -148,28 +235,30 @@ def _collect_trs(soup):
 # New helper: iterate through a td in document order, track last-seen "type" headings (<b><i>..</i></b>) and yield (anchor, current_type)
 def _extract_links_with_types_from_td(td):
     cur_type = None
-    for node in td.descendants:
-        if getattr(node, "name", None):
-            # detect <b> that contains an <i> or plain <b>/<strong> text used as the type label
-            if node.name in ("b", "strong"):
-                i = node.find("i")
-                if i and i.get_text(strip=True):
-                    cur_type = i.get_text(" ", strip=True)
-                else:
-                    txt = node.get_text(" ", strip=True)
-                    if txt:
-                        cur_type = txt
-            # direct <i> tags sometimes appear alone
-            elif node.name == "i" and node.get_text(strip=True):
-                parent = node.parent
-                if parent and parent.name in ("b", "font", "div"):
-                    cur_type = node.get_text(" ", strip=True)
-            elif node.name == "a":
-                a = node
-                txt = a.get_text(" ", strip=True)
+    # walk only the tags we dispatch on, in document order (td.descendants also yields every string and
+    # unrelated tag); each element's text is built at most once
+    for node in td.find_all(("a", "b", "strong", "i")):
+        name = node.name
+        if name == "a":
+            txt = node.get_text(" ", strip=True)
+            if txt:
+                # include href (may be relative) so callers can resolve it
+                yield {"name": txt, "type": cur_type or "", "href": (node.get("href") or "").strip()}
+        # direct <i> tags sometimes appear alone
+        elif name == "i":
+            parent = node.parent
+            if parent and parent.name in ("b", "font", "div"):
+                txt = node.get_text(" ", strip=True)
                 if txt:
-                    # include href (may be relative) so callers can resolve it
-                    yield {"name": txt, "type": cur_type or "", "href": (a.get("href") or "").strip()}
+                    cur_type = txt
+        else:
+            # detect <b> that contains an <i> or plain <b>/<strong> text used as the type label
+            i = node.find("i")
+            txt = i.get_text(" ", strip=True) if i else ""
+            if not txt:
+                txt = node.get_text(" ", strip=True)
+            if txt:
+                cur_type = txt
     # done
 
 def _derive_brand_name(brand_elem, brand_td, brand_id, alpha_map):
@@ -195,7 +284,7 @@ def _derive_brand_name(brand_elem, brand_td, brand_id, alpha_map):
         for f in brand_td.find_all("font"):
             sz = f.get("size") or ""
             try:
-                if sz and int(re.sub(r"\D", "", sz)) >= 4:
+                if sz and int(_DIGITS_RE.sub("", sz)) >= 4:
                     t = norm(f.get_text(" ", strip=True))
                     if t:
                         return t
@@ -227,7 +316,7 @@ def _derive_brand_name(brand_elem, brand_td, brand_id, alpha_map):
             lines = [l.strip() for l in txt.splitlines() if l.strip()]
             for ln in lines:
                 # ignore lines that look like type headings (contain numbers like 1:10 etc)
-                if not re.search(r"\b(1[:/]\d|1:\d|1/\d)\b", ln):
+                if not _SIZE_RE.search(ln):
                     if len(ln) <= 80:
                         return ln
             # fallback to first line
@@ -241,53 +330,72 @@ def _derive_brand_name(brand_elem, brand_td, brand_id, alpha_map):
     return brand_id
 
 def _extract_brands_and_vehicles(soup, base_url):
+    # locate the Vehicle blockquote once; its fallback scans walk the whole document
+    bq = _find_vehicle_blockquote(soup)
+
     # get canonical brand ids from alphabet for name fallback and ordering
-    alpha_map = _extract_alphabet_brands(soup)
-    alpha_order = _extract_alphabet_order(soup)
+    alpha_map = _extract_alphabet_brands(soup, bq)
+    alpha_order = _extract_alphabet_order(soup, bq)
     alpha_ids = set(alpha_map.keys())
 
     logger.info("alpha_id=%s", alpha_ids)
 
-    trs = _collect_trs(soup)
+    trs = _collect_trs(soup, bq)
     logger.info("alpha_order length=%d sample=%s", len(alpha_order), alpha_order[:12])
     logger.info("alpha_map keys count=%d", len(alpha_map))
     logger.info("_collect_trs returned %d <tr> rows", len(trs))
+
+    # snippets below prettify() whole subtrees; only build them when debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    # tr_index: position of each row keyed by identity; Tag.__eq__ compares whole subtrees, so avoid
+    # `tr in trs` / trs.index(tr) list scans.
+    tr_index = {id(tr): i for i, tr in enumerate(trs)}
+    # Single pass over the rows: map every id found inside a <tr> to (first/outermost tr containing it,
+    # the element carrying the id), so brand lookups below are dict hits instead of a scan of all rows per id.
+    tr_by_id = {}
+    for tr in trs:
+        for el in tr.find_all(attrs={"id": True}):
+            tr_by_id.setdefault(el["id"], (tr, el))
+
     # quick check: show whether any selected tr contains the 'Academy' id (helps debugging)
     if "Academy" in alpha_order:
-        found_academy_in_trs = any(tr.find(attrs={"id": "Academy"}) for tr in trs)
-        logger.info("Academy present in selected trs? %s", found_academy_in_trs)
+        logger.info("Academy present in selected trs? %s", "Academy" in tr_by_id)
     # also show first few tr snippets for inspection
-    for k, preview_tr in enumerate(list(trs)[:4]):
-        logger.info("trs[%d] snippet: %s", k, _html_snippet(preview_tr, 300))
+    if debug:
+        for k, preview_tr in enumerate(trs[:4]):
+            logger.debug("trs[%d] snippet: %s", k, _html_snippet(preview_tr, 300))
 
     brands = []
     brand_vehicles = {}
 
+    # vehicle items whose setups page should be fetched; filled per brand, fetched together at the end
+    to_fetch = []
+
     # Build mapping from canonical brand id -> the <tr> that contains the element with that id
     id_to_tr = {}
+    raw = None  # head of the serialized document, built on the first miss (debug only)
     for bid in alpha_order:
         # 1) Prefer to find the canonical id inside the already-selected trs (stronger signal)
-        found = False
-        for tr in trs:
-            el = tr.find(attrs={"id": bid})
-            if el:
-                id_to_tr[bid] = tr
-                found = True
-                logger.info("Found canonical id '%s' inside selected trs. element snippet: %s", bid, _html_snippet(el, 400))
-                logger.info("Parent <tr> snippet: %s", _html_snippet(tr, 800))
-                break
-        if found:
+        hit = tr_by_id.get(bid)
+        if hit:
+            tr, el = hit
+            id_to_tr[bid] = tr
+            logger.info("Found canonical id '%s' inside selected trs", bid)
+            if debug:
+                logger.debug("element snippet: %s", _html_snippet(el, 400))
+                logger.debug("Parent <tr> snippet: %s", _html_snippet(tr, 800))
             continue
 
         # 2) Fallback: look globally in the soup (older pages / odd DOMs)
         el = soup.find(id=bid)
         if el:
             tr = el.find_parent("tr")
-            el_snip = _html_snippet(el, 400)
-            tr_snip = _html_snippet(tr, 800) if tr is not None else "<no parent tr>"
-            in_trs = (tr in trs) if tr is not None else False
-            logger.info("Global lookup for canonical id '%s' found element: %s", bid, el_snip)
-            logger.info("Its parent <tr> (in selected trs=%s): %s", in_trs, tr_snip)
+            in_trs = (id(tr) in tr_index) if tr is not None else False
+            logger.info("Global lookup for canonical id '%s' found element (parent <tr> in selected trs=%s)", bid, in_trs)
+            if debug:
+                logger.debug("element snippet: %s", _html_snippet(el, 400))
+                logger.debug("Its parent <tr>: %s", _html_snippet(tr, 800) if tr is not None else "<no parent tr>")
             # only accept it if that tr is inside the chosen trs (otherwise ignore)
             if tr and in_trs:
                 id_to_tr[bid] = tr
@@ -296,15 +404,19 @@ def _extract_brands_and_vehicles(soup, base_url):
         # 3) Not found inside the selected trs — log for debugging with small context
         logger.info("canonical brand id not found inside selected trs: %s", bid)
         # show a short search context: any elements that contain the bid text as id-like
+        # (debug only: str(soup) serializes the whole document)
+        if not debug:
+            continue
         try:
             # show nearby where the id string appears in raw HTML (if present)
-            raw = str(soup)[:2000]
+            if raw is None:
+                raw = str(soup)[:2000]
             if bid in raw:
                 idx = raw.find(bid)
                 start = max(0, idx - 120)
                 end = min(len(raw), idx + 120)
-                ctx = re.sub(r"\s+", " ", raw[start:end])
-                logger.info("Nearby raw HTML context for '%s': %s", bid, ctx)
+                ctx = _WS_RE.sub(" ", raw[start:end])
+                logger.debug("Nearby raw HTML context for '%s': %s", bid, ctx)
         except Exception:
             pass
 
@@ -312,12 +424,10 @@ def _extract_brands_and_vehicles(soup, base_url):
     ordered_brand_rows = []
     for bid in alpha_order:
         tr = id_to_tr.get(bid)
-        if tr and tr in trs:
-            try:
-                idx = list(trs).index(tr)
-            except ValueError:
-                continue
-            ordered_brand_rows.append((idx, bid, tr))
+        idx = tr_index.get(id(tr)) if tr is not None else None
+        if idx is None:
+            continue
+        ordered_brand_rows.append((idx, bid, tr))
 
     # If we have at least one canonical brand row found, use that ordering to collect vehicles
     if ordered_brand_rows:
@@ -345,67 +455,45 @@ def _extract_brands_and_vehicles(soup, base_url):
             # determine end index (next canonical brand row or end)
             end_idx = ordered_brand_rows[n + 1][0] if n + 1 < len(ordered_brand_rows) else len(trs)
             logger.debug("Brand '%s' scanning trs range: [%d .. %d) (count=%d)", name, idx, end_idx, max(0, end_idx - idx))
-            vehicles = []
+            # keyed by name: dedupes across all tds of the brand's rows at insertion, first occurrence wins
+            vehicles = {}
             for j in range(idx, end_idx):
                 # show each tr we scan
-                try:
-                    tr_snip = _html_snippet(trs[j], 400)
-                except Exception:
-                    tr_snip = "<unavailable>"
-                logger.debug("Scanning trs[%d] for brand '%s': %s", j, name, tr_snip)
+                if debug:
+                    try:
+                        tr_snip = _html_snippet(trs[j], 400)
+                    except Exception:
+                        tr_snip = "<unavailable>"
+                    logger.debug("Scanning trs[%d] for brand '%s': %s", j, name, tr_snip)
                 for td in trs[j].find_all("td"):
-                    td_snip = _html_snippet(td, 240)
                     try:
                         # collect items from this td and log how many
                         items = list(_extract_links_with_types_from_td(td))
                     except Exception as exc:
                         logger.exception("Error extracting links from td while processing brand '%s' at trs[%d]: %s", name, j, exc)
                         items = []
-                    logger.debug("trs[%d] td snippet=%s -> found %d anchors", j, td_snip, len(items))
+                    if debug:
+                        logger.debug("trs[%d] td snippet=%s -> found %d anchors", j, _html_snippet(td, 240), len(items))
                     for item in items:
-                        vehicles.append(item)
-
-            # dedupe while preserving order
-            seen = set()
-            dedup = []
-            for v in vehicles:
-                vn = v.get("name")
-                if vn not in seen:
-                    seen.add(vn)
-                    dedup.append(v)
-            # Resolve hrefs and fetch setups for items that have links
-            fetched = 0
+                        vehicles.setdefault(item["name"], item)
+
+            dedup = list(vehicles.values())
+            # Resolve hrefs; vehicle pages within the per-brand limit are queued and fetched concurrently below
+            queued = 0
             for item in dedup:
                 href = (item.get("href") or "").strip()
-                if href:
-                    # resolve absolute
-                    abs_url = _ensure_abs_url(href, base_url)
-                    item["url"] = abs_url
-                    if fetched < MAX_VEHICLE_SETUP_FETCH:
-                        try:
-                            rows, pdf_url, images = _fetch_vehicle_setups(abs_url)
-                            item["setups"] = rows
-                            item["setup_url"] = pdf_url or ""
-                            item["setup_images"] = images or []
-                            fetched += 1
-                            logger.info("Fetched %d setups for vehicle '%s' at %s (fetched_count=%d) images=%d pdf=%s",
-                                        len(item["setups"]), item.get("name"), abs_url, fetched, len(item.get("setup_images", [])), item.get("setup_url", ""))
-                        except Exception as exc:
-                            logger.exception("Error fetching setups for %s: %s", abs_url, exc)
-                            item["setups"] = []
-                            item["setup_url"] = ""
-                            item["setup_images"] = []
-                    else:
-                        # skip fetching further vehicle pages, keep placeholder
-                        item["setups"] = []
-                        item["setup_url"] = ""
-                        item["setup_images"] = []
-                        logger.debug("Skipping fetching setups for '%s' at %s — reached limit %d", item.get("name"), abs_url, MAX_VEHICLE_SETUP_FETCH)
+                item["url"] = _ensure_abs_url(href, base_url) if href else ""
+                item["setups"] = []
+                item["setup_url"] = ""
+                item["setup_images"] = []
+                if not href:
+                    continue
+                if queued < MAX_VEHICLE_SETUP_FETCH:
+                    to_fetch.append(item)
+                    queued += 1
                 else:
-                    item["url"] = ""
-                    item["setups"] = []
-                    item["setup_url"] = ""
-                    item["setup_images"] = []
+                    # skip fetching further vehicle pages, keep placeholder
+                    logger.debug("Skipping fetching setups for '%s' at %s — reached limit %d", item.get("name"), item["url"], MAX_VEHICLE_SETUP_FETCH)
             brand_vehicles[name] = dedup
 
             # DOM fallback: if canonical trs-range scan found nothing, walk the document forward
@@ -417,7 +505,9 @@ def _extract_brands_and_vehicles(soup, base_url):
                 stop_on_ids = set(alpha_ids) - {bid}
                 max_steps = 20000
                 steps = 0
-                fetched_fb = 0
+                queued_fb = 0
+                # last type heading (<b>/<i> without links) passed on the walk, as in _extract_links_with_types_from_td
+                cur_type = ""
                 for node in brand_elem.next_elements:
                     steps += 1
                     if steps > max_steps:
@@ -429,45 +519,25 @@ def _extract_brands_and_vehicles(soup, base_url):
                             if nid and nid in stop_on_ids:
                                 logger.debug("DOM fallback for '%s' stopped at encountered canonical id=%s", name, nid)
                                 break
-                        if getattr(node, "name", None) == "a":
+                        tag_name = getattr(node, "name", None)
+                        if tag_name in ("b", "i"):
+                            if node.find("a") is None:
+                                heading = node.get_text(" ", strip=True)
+                                if heading:
+                                    cur_type = heading
+                        elif tag_name == "a":
                             txt = node.get_text(" ", strip=True)
                             href = (node.get("href") or "").strip()
                             if txt and txt not in seen_names:
-                                # attempt to recover a nearby type heading
-                                ttype = ""
-                                p = node
-                                for _ in range(6):
-                                    p = getattr(p, "parent", None)
-                                    if p is None:
-                                        break
-                                    btag = p.find(lambda t: getattr(t, "name", None) in ("b", "i") and t.find("a") is None)
-                                    if btag and btag.get_text(strip=True):
-                                        ttype = btag.get_text(" ", strip=True)
-                                        break
-                                item = {"name": txt, "type": ttype, "href": href}
+                                item = {"name": txt, "type": cur_type, "href": href,
+                                        "url": _ensure_abs_url(href, base_url) if href else "",
+                                        "setups": [], "setup_url": "", "setup_images": []}
                                 if href:
-                                    item["url"] = _ensure_abs_url(href, base_url)
-                                    if fetched_fb < MAX_VEHICLE_SETUP_FETCH:
-                                        try:
-                                            rows, pdf_url, images = _fetch_vehicle_setups(item["url"])
-                                            item["setups"] = rows
-                                            item["setup_url"] = pdf_url or ""
-                                            item["setup_images"] = images or []
-                                            fetched_fb += 1
-                                        except Exception:
-                                            item["setups"] = []
-                                            item["setup_url"] = ""
-                                            item["setup_images"] = []
+                                    if queued_fb < MAX_VEHICLE_SETUP_FETCH:
+                                        to_fetch.append(item)
+                                        queued_fb += 1
                                     else:
-                                        item["setups"] = []
-                                        item["setup_url"] = ""
-                                        item["setup_images"] = []
                                         logger.debug("DOM fallback skipping setups fetch for '%s' at %s — reached limit %d", txt, item["url"], MAX_VEHICLE_SETUP_FETCH)
-                                else:
-                                    item["url"] = ""
-                                    item["setups"] = []
-                                    item["setup_url"] = ""
-                                    item["setup_images"] = []
                                 fallback_items.append(item)
                                 seen_names.add(txt)
                     except Exception:
@@ -478,6 +548,23 @@ def _extract_brands_and_vehicles(soup, base_url):
                     brand_vehicles[name] = fallback_items
                 else:
                     logger.info("DOM fallback also found no anchors for brand '%s' (id=%s)", name, bid)
+    # Fetch all queued vehicle pages concurrently (bounded by _FETCH_SLOTS); each future fills its own item
+    if to_fetch:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as ex:
+            futures = {ex.submit(_fetch_vehicle_setups, item["url"]): item for item in to_fetch}
+            for fut in as_completed(futures):
+                item = futures[fut]
+                try:
+                    rows, pdf_url, images = fut.result()
+                except Exception as exc:
+                    logger.exception("Error fetching setups for %s: %s", item["url"], exc)
+                    continue
+                item["setups"] = rows
+                item["setup_url"] = pdf_url or ""
+                item["setup_images"] = images or []
+                logger.info("Fetched %d setups for vehicle '%s' at %s images=%d pdf=%s",
+                            len(rows), item.get("name"), item["url"], len(item["setup_images"]), item["setup_url"])
+
     # Also include brands found in the alphabetical block that might not have been captured above
     alpha = alpha_map  # already extracted
     existing_ids = {b["id"] for b in brands}
@@ -489,34 +576,94 @@ def _extract_brands_and_vehicles(soup, base_url):
     # Ensure we always return the expected tuple even if earlier logic fell through.
     return brands, brand_vehicles
 
-def _extract_assets_from_soup(soup, base_url):
-    """Return (pdf_abs_or_empty, [abs_image_urls...]) found in the soup, resolved against base_url."""
+def _collect_assets(nodes, base_url):
+    """
+    Shared core of the asset extractors: pick the first PDF from anchor hrefs and collect
+    image URLs from anchor hrefs then <img> srcs, resolved against base_url and deduped.
+    `nodes` yields (tag_name, attr_value) pairs for <a href> / <img src> in document order.
+    Returns (pdf_abs_or_empty, [abs_image_urls...]).
+    """
     pdf = ""
     imgs = []
+    seen = set()
+    srcs = []
     try:
-        for a in soup.find_all("a", href=True):
-            ah = (a["href"] or "").strip()
-            if not ah:
+        for tag, val in nodes:
+            val = (val or "").strip()
+            if not val:
+                continue
+            if tag == "img":
+                # keep anchor images ahead of <img> srcs, as before
+                srcs.append(val)
                 continue
-            if re.search(r'\.pdf($|\?)', ah, re.I) and not pdf:
-                pdf = _ensure_abs_url(ah, base_url)
-            if re.search(r'\.(jpe?g|png|gif|bmp)($|\?)', ah, re.I):
-                imgs.append(_ensure_abs_url(ah, base_url))
-        for img in soup.find_all("img", src=True):
-            src = (img["src"] or "").strip()
-            if src:
-                imgs.append(_ensure_abs_url(src, base_url))
+            if not pdf and _PDF_RE.search(val):
+                pdf = _ensure_abs_url(val, base_url)
+            if _IMG_RE.search(val):
+                u = _ensure_abs_url(val, base_url)
+                if u not in seen:
+                    seen.add(u)
+                    imgs.append(u)
     except Exception:
         # be tolerant — caller will handle empties
         pass
-    # dedupe while preserving order
-    out = []
-    seen = set()
-    for u in imgs:
-        if u and u not in seen:
+    for src in srcs:
+        try:
+            u = _ensure_abs_url(src, base_url)
+        except ValueError:
+            # malformed src (e.g. a bad IPv6 literal): skip this asset, keep the rest
+            continue
+        if u not in seen:
             seen.add(u)
-            out.append(u)
-    return (pdf or "", out)
+            imgs.append(u)
+    return (pdf or "", imgs)
+
+def _extract_assets_from_soup(soup, base_url):
+    """Return (pdf_abs_or_empty, [abs_image_urls...]) found in the soup, resolved against base_url."""
+    # one tree walk for both tags instead of separate <a> and <img> passes
+    return _collect_assets(
+        ((el.name, el.get("href") if el.name == "a" else el.get("src")) for el in soup.find_all(("a", "img"))),
+        base_url,
+    )
+
+def _extract_assets_from_html(html, base_url):
+    """Same as _extract_assets_from_soup but parses raw page bytes, with selectolax when enabled."""
+    if not USE_SELECTOLAX:
+        return _extract_assets_from_soup(BeautifulSoup(html, _PARSER), base_url)
+    # lexbor reads bytes as UTF-8 unless asked to sniff the BOM / <meta charset>, as BS4 does
+    tree = LexborHTMLParser(html, encoding=True)
+    return _collect_assets(
+        ((n.tag, n.attributes.get("href") if n.tag == "a" else n.attributes.get("src"))
+         for n in tree.css("a[href], img[src]")),
+        base_url,
+    )
+
+@lru_cache(maxsize=2048)
+def _fetch_driver_assets(driver_url, timeout=10):
+    """
+    Fetch a per-driver setup page and return (pdf_abs_or_empty, (abs_image_urls...)).
+
+    Cached per URL because one driver usually appears in many setup rows; cleared at the start of
+    each scrape(). Fetch errors raise and are not cached.
+    """
+    # per-driver pages are only scanned for assets, so skip building a BeautifulSoup tree
+    pdf_abs, imgs_abs = _extract_assets_from_html(_fetch_html(driver_url, timeout=timeout), driver_url)
+    return pdf_abs, tuple(imgs_abs)
+
+def _fill_setup_assets(driver_url, rows, timeout=10):
+    """Fetch one per-driver page and fill setup_url / setup_images on every setup row that links to it."""
+    try:
+        pdf_abs, imgs_abs = _fetch_driver_assets(driver_url, timeout)
+    except requests.RequestException as exc:
+        logger.debug("Failed to fetch per-setup page %s: %s", driver_url, exc)
+        return
+    except Exception as exc:
+        logger.exception("Error extracting per-setup assets for %s: %s", driver_url, exc)
+        return
+    for s in rows:
+        s["setup_url"] = pdf_abs or ""
+        s["setup_images"] = list(imgs_abs)
+        logger.info("Per-setup assets for %s -> driver=%s setup_url=%s images=%d",
+                    driver_url, s.get("driver", "<unknown>"), s["setup_url"], len(s["setup_images"]))
 
 def _fetch_vehicle_setups(vehicle_url, timeout=10):
     """
@@ -545,6 +692,10 @@ def _fetch_vehicle_setups(vehicle_url, timeout=10):
 
     # 1) extract the setups table rows
     for table in vsoup.find_all("table"):
+        # cheap whole-table check first: a header row can only exist if the table text has the key words
+        tbl_txt = table.get_text(" ", strip=True).lower()
+        if "driver" not in tbl_txt or ("traction" not in tbl_txt and "composition" not in tbl_txt):
+            continue
         header_tr = None
         for tr in table.find_all("tr"):
             header_texts = " ".join([td.get_text(" ", strip=True).lower() for td in tr.find_all(["td", "th"])])
@@ -608,28 +759,19 @@ def _fetch_vehicle_setups(vehicle_url, timeout=10):
         setup_pdf = ""
         setup_images = []
 
-    # 3) For each setup row that has a driver_url, visit that page and extract per-setup assets
+    # 3) For each setup row that has a driver_url, visit that page and extract per-setup assets.
+    #    Rows are grouped by resolved driver page so each page is fetched once; distinct pages are
+    #    independent, so fetch them on a thread pool (bounded by _FETCH_SLOTS).
+    rows_by_driver = {}
     for s in setups:
         dr_href = (s.get("driver_url") or "").strip()
         if not dr_href:
             continue
-        try:
-            abs_dr = _ensure_abs_url(dr_href, vehicle_url)
-            s["driver_url"] = abs_dr
-            try:
-                dsoup = _get_soup(abs_dr, timeout=timeout)
-            except Exception as exc:
-                logger.debug("Failed to fetch per-setup page %s: %s", abs_dr, exc)
-                continue
-            pdf_abs, imgs_abs = _extract_assets_from_soup(dsoup, abs_dr)
-            s["setup_url"] = pdf_abs or ""
-            s["setup_images"] = imgs_abs or []
-            logger.info("Per-setup assets for %s -> driver=%s setup_url=%s images=%d",
-                        abs_dr, s.get("driver", "<unknown>"), s["setup_url"], len(s["setup_images"]))
-        except Exception as exc:
-            logger.exception("Error extracting per-setup assets for %s (base %s): %s", dr_href, vehicle_url, exc)
-            s["setup_url"] = ""
-            s["setup_images"] = []
+        s["driver_url"] = _ensure_abs_url(dr_href, vehicle_url)
+        rows_by_driver.setdefault(s["driver_url"], []).append(s)
+    if rows_by_driver:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as ex:
+            list(ex.map(lambda kv: _fill_setup_assets(kv[0], kv[1], timeout), rows_by_driver.items()))
 
     return setups, (setup_pdf or ""), (setup_images or [])
 
@@ -647,6 +789,8 @@ def scrape(url, out_path="scrape_results/petitrc_setups.json"):
     Writes results to `out_path` (UTF-8, pretty-printed). If out_path is None, no file is written.
     """
     logger.info("scrape: fetching %s", url)
+    # driver pages are only reused within one run; don't serve stale assets on a warm Lambda container
+    _fetch_driver_assets.cache_clear()
     soup = _get_soup(url)
     vehicle_types = _extract_vehicle_types(soup)
     brands, brand_vehicles = _extract_brands_and_vehicles(soup, url)
@@ -654,8 +798,12 @@ def scrape(url, out_path="scrape_results/petitrc_setups.json"):
 
     if out_path:
         try:
-            with open(out_path, "w", encoding="utf-8") as fh:
-                json.dump(result, fh, ensure_ascii=False, indent=2)
+            if orjson is not None:
+                with open(out_path, "wb") as fh:
+                    fh.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(out_path, "w", encoding="utf-8") as fh:
+                    json.dump(result, fh, ensure_ascii=False, indent=2)
             logger.info("scrape: wrote results to %s", out_path)
             result["file"] = out_path
         except Exception as exc:
@@ -676,7 +824,7 @@ def _html_snippet(el, maxlen=800):
 	except Exception:
 		h = str(el)
 	# collapse whitespace for compact logs
-	h = re.sub(r"\s+", " ", h).strip()
+	h = _WS_RE.sub(" ", h).strip()
 	if len(h) > maxlen:
 		return h[:maxlen] + " ...(truncated)"
 	return h
@@ -1,12 +1,42 @@
 import re
-from bs4 import BeautifulSoup
+import json
+from bs4 import BeautifulSoup, NavigableString
+import soupsieve as sv
 
-def safe_text(el):
-	"""Return normalized text for an element or empty string."""
+# selectors used per cell / per table, compiled once
+_SEL_HIDDEN = sv.compile(".hidden")
+_SEL_RESULT_TABLE = sv.compile("table.race_result, table.dataTable, table.table-striped.race_result")
+_SEL_TBODY_TR = sv.compile("tbody tr")
+
+# racerLaps[<id>] = { ... };
+_OBJ_PAT = re.compile(r"racerLaps\[\s*(?P<id>\d+)\s*\]\s*=\s*(\{.*?\});", re.DOTALL)
+# start of the 'laps' array; its end is found by bracket matching (_LAPS_TOKEN skips over string literals)
+# (the lookbehind stops e.g. prevlaps from matching as laps)
+_LAPS_START = re.compile(r"(?<![\w$])['\"]?laps['\"]?\s*:\s*\[")
+_LAPS_TOKEN = re.compile(r"[\[\]]|'[^']*'|\"[^\"]*\"")
+# bare lap keys to quote before handing the array to json.loads
+_BAREKEY = re.compile(r"([{,]\s*)(lapNum|pos|time|pace)\s*:")
+_LAP_KEYS = ("lapNum", "pos", "time", "pace")
+# fallback when the array isn't JSON-compatible: lap objects with single or double quoted keys, tolerant whitespace
+_LAP_PAT = re.compile(
+	r"\{\s*['\"]?lapNum['\"]?\s*:\s*['\"](?P<lapNum>[^'\"]*)['\"]\s*,\s*['\"]?pos['\"]?\s*:\s*['\"](?P<pos>[^'\"]*)['\"]\s*,\s*['\"]?time['\"]?\s*:\s*['\"](?P<time>[^'\"]*)['\"]\s*,\s*['\"]?pace['\"]?\s*:\s*['\"](?P<pace>[^'\"]*)['\"][^\}]*\}",
+	re.DOTALL,
+)
+_STAT_KEYS = ("fastLap", "avgLap", "avgTop5", "avgTop10", "avgTop15", "consistency")
+# any stat key : 'value' with the key quoted or bare; one finditer pass covers all keys
+# (the lookbehind stops e.g. bestfastLap from matching as fastLap)
+_STATS_PAT = re.compile(r"(?<![\w$])(['\"])?(%s)(['\"])?\s*:\s*['\"]([^'\"]*)['\"]" % "|".join(_STAT_KEYS))
+
+def safe_text(el, sep=" "):
+	"""Return normalized text for an element or empty string (get_text(sep, strip=True))."""
 	if el is None:
 		return ""
 	try:
-		return el.get_text(" ", strip=True)
+		# leaf cells: a single plain text child needs no descendant walk (exact type excludes Comment etc.)
+		s = el.string
+		if type(s) is NavigableString:
+			return s.strip()
+		return el.get_text(sep, strip=True)
 	except Exception:
 		return ""
 
@@ -14,19 +44,67 @@ def prefer_hidden(cell):
 	"""If cell contains .hidden with useful value return that, otherwise visible text."""
 	if cell is None:
 		return ""
-	hidden = cell.select_one(".hidden")
-	if hidden and hidden.get_text(strip=True):
-		return hidden.get_text(strip=True)
+	hidden_text = safe_text(_SEL_HIDDEN.select_one(cell), "")
+	if hidden_text:
+		return hidden_text
 	return safe_text(cell)
 
-def extract_script_text(soup):
-	"""Concatenate all inline <script> text for scanning JS objects."""
+def extract_script_text(soup, contains=None):
+	"""
+	Concatenate all inline <script> text for scanning JS objects.
+	With `contains` (a substring or tuple of substrings) only scripts mentioning one of them are kept,
+	e.g. extract_script_text(soup, "racerLaps[") before parse_racerlaps_from_js.
+	"""
+	if isinstance(contains, str):
+		contains = (contains,)
 	parts = []
 	for s in soup.find_all("script"):
-		if s.string:
-			parts.append(s.string)
+		text = s.string
+		if not text:
+			continue
+		if contains and not any(c in text for c in contains):
+			continue
+		parts.append(text)
 	return "\n".join(parts)
 
+def _parse_laps_array(js_obj):
+	"""
+	Return the lap dicts of the 'laps' array in a racerLaps object, or None when the array
+	is missing or not JSON-compatible after quoting (caller falls back to _LAP_PAT).
+	"""
+	m = _LAPS_START.search(js_obj)
+	if not m:
+		return None
+	start = m.end() - 1
+	depth = 0
+	end = None
+	for tm in _LAPS_TOKEN.finditer(js_obj, start):
+		tok = tm.group()
+		if tok == "[":
+			depth += 1
+		elif tok == "]":
+			depth -= 1
+			if depth == 0:
+				end = tm.end()
+				break
+	if end is None:
+		return None
+	chunk = _BAREKEY.sub(r'\1"\2":', js_obj[start:end].replace("'", '"'))
+	try:
+		# keep numbers as their source text (12.340 must not become "12.34")
+		items = json.loads(chunk, parse_float=str, parse_int=str)
+	except ValueError:
+		return None
+	laps = []
+	for d in items:
+		if isinstance(d, dict) and all(k in d for k in _LAP_KEYS):
+			lap = {k: d[k] for k in _LAP_KEYS}
+			# null / true / false have no faithful string form; let _LAP_PAT decide
+			if not all(isinstance(v, str) for v in lap.values()):
+				return None
+			laps.append(lap)
+	return laps
+
 def parse_racerlaps_from_js(script_text):
 	"""
 	Parse racerLaps[ID] = { ... } blocks from JS and return mapping id -> { lap_stats, laps }.
@@ -36,53 +114,39 @@ def parse_racerlaps_from_js(script_text):
 	if not script_text:
 		return out
 
-	# Find all racerLaps[<id>] = { ... };
-	obj_pat = re.compile(r"racerLaps\[\s*(?P<id>\d+)\s*\]\s*=\s*(\{.*?\});", re.DOTALL)
-	for m in obj_pat.finditer(script_text):
+	for m in _OBJ_PAT.finditer(script_text):
 		driver_id = m.group("id")
 		js_obj = m.group(2)
 
-		def js_field(key):
-			# try 'key' : 'value' patterns
-			r = re.search(r"['\"]%s['\"]\s*:\s*['\"]([^'\"]*)['\"]" % re.escape(key), js_obj)
-			if not r:
-				r = re.search(r"%s\s*:\s*['\"]([^'\"]*)['\"]" % re.escape(key), js_obj)
-			return r.group(1) if r else ""
-
-		lap_stats = {
-			"fastLap": js_field("fastLap"),
-			"avgLap": js_field("avgLap"),
-			"avgTop5": js_field("avgTop5"),
-			"avgTop10": js_field("avgTop10"),
-			"avgTop15": js_field("avgTop15"),
-			"consistency": js_field("consistency"),
-		}
+		# first occurrence wins, and a quoted key beats a bare one, as with the old per-key searches
+		quoted = {}
+		bare = {}
+		for sm in _STATS_PAT.finditer(js_obj):
+			(quoted if sm.group(1) and sm.group(3) else bare).setdefault(sm.group(2), sm.group(4))
+		lap_stats = {k: quoted.get(k, bare.get(k, "")) for k in _STAT_KEYS}
 
 		# Extract lap objects inside 'laps' array
-		laps = []
-		# accept both single and double quoted keys, tolerant whitespace
-		lap_pat = re.compile(
-			r"\{\s*['\"]?lapNum['\"]?\s*:\s*['\"](?P<lapNum>[^'\"]*)['\"]\s*,\s*['\"]?pos['\"]?\s*:\s*['\"](?P<pos>[^'\"]*)['\"]\s*,\s*['\"]?time['\"]?\s*:\s*['\"](?P<time>[^'\"]*)['\"]\s*,\s*['\"]?pace['\"]?\s*:\s*['\"](?P<pace>[^'\"]*)['\"][^\}]*\}",
-			re.DOTALL,
-		)
-		for lm in lap_pat.finditer(js_obj):
-			laps.append({
-				"lapNum": lm.group("lapNum"),
-				"pos": lm.group("pos"),
-				"time": lm.group("time"),
-				"pace": lm.group("pace"),
-			})
+		laps = _parse_laps_array(js_obj)
+		if laps is None:
+			laps = []
+			for lm in _LAP_PAT.finditer(js_obj):
+				laps.append({
+					"lapNum": lm.group("lapNum"),
+					"pos": lm.group("pos"),
+					"time": lm.group("time"),
+					"pace": lm.group("pace"),
+				})
 
 		out[driver_id] = {"lap_stats": lap_stats, "laps": laps}
 	return out
 
 def find_race_result_table(soup):
 	"""Return the table element for race results (prefer class selectors)."""
-	tbl = soup.select_one("table.race_result, table.dataTable, table.table-striped.race_result")
+	tbl = _SEL_RESULT_TABLE.select_one(soup)
 	if tbl:
 		return tbl
 	# fallback to first table with tbody rows
 	for t in soup.find_all("table"):
-		if t.select("tbody tr"):
+		if _SEL_TBODY_TR.select_one(t):
 			return t
 	return None
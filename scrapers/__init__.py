@@ -1,12 +1,17 @@
 # package init for scrapers
 from .events import scrape_events, scrape_events_via_ajax, scrape_events_with_playwright
-from .entries import scrape_entry_list
-from .event_page import scrape_event_entries
+from .entries import Racer, scrape_entry_list
+from .event_page import scrape_event_entries, scrape_event_entries_many
+from ._common import load_etag_store, save_etag_store
 
 __all__ = [
     "scrape_events",
     "scrape_events_via_ajax",
     "scrape_events_with_playwright",
     "scrape_entry_list",
+    "Racer",
     "scrape_event_entries",
+    "scrape_event_entries_many",
+    "load_etag_store",
+    "save_etag_store",
 ]
@@ -1,16 +1,168 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
 import logging
+import json
+import os
 
 logger = logging.getLogger("scrapers.common")
 
-def get_soup(url, timeout=10):
-    """Fetch URL and return BeautifulSoup. Raises on HTTP errors."""
+# prefer the C-backed lxml parser; fall back to the stdlib parser if lxml isn't installed
+try:
+    import lxml  # only probed here, BeautifulSoup loads it by name
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+# shared session: pooled keep-alive connections for all scrapers (sized for get_soups fan-out);
+# same identity and retry policy as scraper._SESSION. No Accept override: the AJAX endpoints may answer JSON.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; setuprc-scraper/1.0)",
+    "Connection": "keep-alive",
+})
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("http://", _ADAPTER)
+SESSION.mount("https://", _ADAPTER)
+
+# politeness cap: at most this many page requests in flight, however wide get_soups fans out
+MAX_CONCURRENT_FETCHES = 8
+_FETCH_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_FETCHES)
+
+# upper bound on a single page body
+MAX_RESPONSE_BYTES = 2_000_000
+
+# validators from earlier runs (url -> {"etag", "last_modified", "since"}) for conditional GETs; /tmp survives
+# warm Lambda starts
+ETAG_CACHE_PATH = "/tmp/etag_cache.json"
+
+def load_etag_store(path=ETAG_CACHE_PATH):
+    """Return the persisted etag store, or an empty one if missing/unreadable."""
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            store = json.load(fh)
+        return store if isinstance(store, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except Exception as exc:
+        logger.debug("ignoring unreadable etag cache %s: %s", path, exc)
+        return {}
+
+def save_etag_store(store, path=ETAG_CACHE_PATH):
+    """
+    Persist the etag store (write to a temp file, then rename). This is the commit step: call it
+    only after the rows scraped with the store have been processed, so a failed run is re-fetched.
+    """
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as fh:
+            json.dump(store, fh)
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.warning("failed to save etag cache %s: %s", path, exc)
+
+def _read_capped(resp, url):
+    """Read a streamed response body, decoded, stopping at MAX_RESPONSE_BYTES."""
+    data = resp.raw.read(MAX_RESPONSE_BYTES, decode_content=True)
+    if len(data) >= MAX_RESPONSE_BYTES:
+        logger.warning("Response from %s truncated at %d bytes", url, MAX_RESPONSE_BYTES)
+    return data
+
+@lru_cache(maxsize=32)
+def _fetch_bytes(url, timeout=10):
+    """
+    GET url and return the decoded body bytes (at most MAX_RESPONSE_BYTES). Raises on HTTP errors.
+
+    Cached per URL so pages revisited within a run (e.g. the events page re-read by the AJAX
+    fallback) aren't re-downloaded; bytes are cached rather than soups because soups are mutable.
+    Errors raise and are not cached. The public scrape entry points call clear_page_cache() first,
+    so nothing is served across runs (warm Lambda, long-lived callers).
+    """
     logger.debug("GET %s", url)
-    resp = requests.get(url, timeout=timeout)
-    resp.raise_for_status()
-    return BeautifulSoup(resp.text, "html.parser")
+    # stream straight into one bytes buffer instead of building resp.content and then resp.text
+    with _FETCH_SLOTS, SESSION.get(url, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        return _read_capped(resp, url)
+
+def clear_page_cache():
+    """Drop cached page bytes; called at the start of each scrape entry point."""
+    _fetch_bytes.cache_clear()
+
+def _fetch_bytes_conditional(url, timeout, seen):
+    """
+    Conditional GET using the validators in `seen` ({"etag", "last_modified"}, may be empty).
+    Returns (body bytes or None on 304 Not Modified, validators from the response or None).
+    Bypasses the _fetch_bytes cache.
+    """
+    headers = {}
+    if seen.get("etag"):
+        headers["If-None-Match"] = seen["etag"]
+    if seen.get("last_modified"):
+        headers["If-Modified-Since"] = seen["last_modified"]
+    logger.debug("GET %s (conditional=%s)", url, bool(headers))
+    with _FETCH_SLOTS, SESSION.get(url, timeout=timeout, stream=True, headers=headers) as resp:
+        if resp.status_code == 304:
+            logger.info("GET %s -> 304 Not Modified", url)
+            return None, None
+        resp.raise_for_status()
+        data = _read_capped(resp, url)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        return data, {"etag": etag, "last_modified": last_modified}
+    return data, None
+
+def get_soup(url, timeout=10, parse_only=None):
+    """
+    Fetch URL and return BeautifulSoup. Raises on HTTP errors.
+    Pass a SoupStrainer as `parse_only` to build only the matching subtrees.
+    """
+    # hand lxml the raw bytes so it does its own encoding detection
+    return BeautifulSoup(_fetch_bytes(url, timeout=timeout), PARSER, parse_only=parse_only)
+
+def get_soup_if_modified(url, seen, timeout=10, parse_only=None):
+    """
+    Conditional variant of get_soup using the validators in `seen` (see load_etag_store).
+    Returns (soup, validators): (None, None) when the page is unchanged, otherwise the parsed page
+    and the response's validators (None if it sent none). Nothing is recorded here; callers store
+    the validators once they have used the page.
+    """
+    data, validators = _fetch_bytes_conditional(url, timeout, seen or {})
+    if data is None:
+        return None, None
+    return BeautifulSoup(data, PARSER, parse_only=parse_only), validators
+
+def get_soups(urls, timeout=10, max_workers=16):
+    """
+    Fetch several URLs concurrently and return { url: BeautifulSoup }.
+    URLs that fail to fetch are logged and left out of the result.
+    """
+    urls = list(dict.fromkeys(urls))
+    out = {}
+    if not urls:
+        return out
+
+    def fetch(url):
+        try:
+            return url, get_soup(url, timeout=timeout)
+        except Exception as exc:
+            logger.warning("GET %s failed: %s", url, exc)
+            return url, None
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as ex:
+        for url, soup in ex.map(fetch, urls):
+            if soup is not None:
+                out[url] = soup
+    return out
 
 # re-export urljoin for convenience
 from urllib.parse import urljoin as _urljoin
@@ -1,17 +1,47 @@
 import logging
-from ._common import get_soup
+import sys
+from dataclasses import dataclass
+import soupsieve as sv
+from ._common import clear_page_cache, get_soup
+from scraper_helpers import safe_text
 logger = logging.getLogger("scrapers.entries")
 
+# selectors used per tab / per row, compiled once
+_SEL_TAB_PANE = sv.compile(".tab-pane")
+_SEL_CLASS_HEADER = sv.compile(".class_header")
+_SEL_TBODY_TR = sv.compile("tbody tr")
+
+@dataclass(slots=True)
+class Racer:
+    """One entry-list row while parsing; cls is the class (tab) the racer is entered in."""
+    name: str
+    transponder: str
+    cls: str = ""
+
+    def to_dict(self):
+        """Wire format of a racer in scrape results: { name, transponder, class }."""
+        return {"name": self.name, "transponder": self.transponder, "class": self.cls}
+
 def scrape_entry_list(entry_url):
     """
     Parse an entry-list page and return list of { class: 'Class Name', racers: [ { name, transponder } ] }.
     """
     logger.info("scrape_entry_list: %s", entry_url)
-    soup = get_soup(entry_url)
+    clear_page_cache()
+    return [
+        {"class": cl["class"], "racers": [{"name": r.name, "transponder": r.transponder} for r in cl["racers"]]}
+        for cl in parse_entry_list(get_soup(entry_url))
+    ]
+
+def parse_entry_list(soup):
+    """
+    Parse an already-fetched entry-list page into [ { class, racers: [ Racer, ... ] } ].
+    Racers stay Racer objects here; public results convert them with Racer.to_dict().
+    """
     results = []
-    for tab in soup.select(".tab-pane"):
+    for tab in _SEL_TAB_PANE.select(soup):
         class_name = None
-        hdr = tab.select_one(".class_header")
+        hdr = _SEL_CLASS_HEADER.select_one(tab)
         if hdr and hdr.get_text(strip=True):
             class_name = hdr.get_text(strip=True)
         else:
@@ -24,13 +54,15 @@ def scrape_entry_list(entry_url):
         table = tab.find("table")
         if not table:
             continue
+        # one shared str per class name; every Racer.cls and the result point at it
+        class_name = sys.intern(class_name or "")
 
         racers = []
-        for tr in table.select("tbody tr"):
+        for tr in _SEL_TBODY_TR.select(table):
             tds = tr.find_all("td")
             if len(tds) >= 3:
-                driver = tds[1].get_text(" ", strip=True)
-                transponder = tds[2].get_text(strip=True)
+                driver = safe_text(tds[1])
+                transponder = safe_text(tds[2], "")
             else:
                 texts = [c.get_text(strip=True) for c in tr.find_all(["td", "th"])]
                 if len(texts) >= 2:
@@ -38,7 +70,10 @@ def scrape_entry_list(entry_url):
                     transponder = texts[2] if len(texts) > 2 else ""
                 else:
                     continue
-            racers.append({"name": driver, "transponder": transponder})
-        results.append({"class": class_name or "", "racers": racers})
+            if transponder:
+                # transponders repeat across classes and events
+                transponder = sys.intern(transponder)
+            racers.append(Racer(name=driver, transponder=transponder, cls=class_name))
+        results.append({"class": class_name, "racers": racers})
     logger.info("scrape_entry_list -> %d classes", len(results))
     return results
@@ -1,42 +1,83 @@
 import logging
-from ._common import get_soup, join
-from .entries import scrape_entry_list
+from ._common import clear_page_cache, get_soup, get_soups, join
+from .entries import parse_entry_list
 
 logger = logging.getLogger("scrapers.event_page")
 
+def _find_entry_href(event_soup):
+    """Return the Entry List href from an event page, or None."""
+    clickable = event_soup.select_one('tr.clickable-row[data-href*="view_entry_list"]')
+    if clickable and clickable.get("data-href"):
+        return clickable.get("data-href")
+    a = event_soup.select_one('a[href*="view_entry_list"]')
+    if a and a.get("href"):
+        return a.get("href")
+    return None
+
+def _event_result(event_title, event_url, entry_url, classes):
+    # racers already carry their class; flatten straight into the wire format
+    racers = [r.to_dict() for cl in classes for r in cl["racers"]]
+
+    result = {
+        "trackName": "",
+        "events": [{"title": event_title, "link": event_url, "entry_list": entry_url}],
+        "racers": racers,
+    }
+    logger.info("scrape_event_entries: found %d racers for %s", len(racers), event_title)
+    return result
+
 def scrape_event_entries(event_title, event_url):
     """
     Visit an event page, find Entry List link and extract racers.
     Returns { trackName: '', events: [...], racers: [ { name, transponder, class } ] }.
     """
     logger.info("scrape_event_entries: %s", event_url)
+    clear_page_cache()
     event_soup = get_soup(event_url)
 
-    entry_href = None
-    clickable = event_soup.select_one('tr.clickable-row[data-href*="view_entry_list"]')
-    if clickable and clickable.get("data-href"):
-        entry_href = clickable.get("data-href")
-    if not entry_href:
-        a = event_soup.select_one('a[href*="view_entry_list"]')
-        if a and a.get("href"):
-            entry_href = a.get("href")
-
+    entry_href = _find_entry_href(event_soup)
     if not entry_href:
         logger.warning("No Entry List link found on %s", event_url)
         return {"trackName": "", "events": [{"title": event_title, "link": event_url}], "racers": []}
 
     entry_url = join(event_url, entry_href)
-    classes = scrape_entry_list(entry_url)
+    classes = parse_entry_list(get_soup(entry_url))
+    return _event_result(event_title, event_url, entry_url, classes)
 
-    racers = []
-    for cl in classes:
-        for r in cl.get("racers", []):
-            racers.append({"name": r.get("name"), "transponder": r.get("transponder"), "class": cl.get("class")})
+def scrape_event_entries_many(events, max_workers=16):
+    """
+    Batch version of scrape_event_entries for an iterable of (event_title, event_url).
+    Event pages, then entry lists, are fetched concurrently; results keep input order.
+    Events whose event page or entry list fails to fetch are logged (title and URL) and omitted.
+    """
+    events = list(events)
+    logger.info("scrape_event_entries_many: %d events", len(events))
+    clear_page_cache()
+    event_soups = get_soups([url for _, url in events], max_workers=max_workers)
 
-    result = {
-        "trackName": "",
-        "events": [{"title": event_title, "link": event_url, "entry_list": entry_url}],
-        "racers": racers,
-    }
-    logger.info("scrape_event_entries: found %d racers for %s", len(racers), event_title)
-    return result
+    entry_urls = {}
+    for _, event_url in events:
+        event_soup = event_soups.get(event_url)
+        if event_soup is None:
+            continue
+        entry_href = _find_entry_href(event_soup)
+        if entry_href:
+            entry_urls[event_url] = join(event_url, entry_href)
+    entry_soups = get_soups(entry_urls.values(), max_workers=max_workers)
+
+    results = []
+    for event_title, event_url in events:
+        if event_soups.get(event_url) is None:
+            logger.warning("Skipping event %r: failed to fetch %s", event_title, event_url)
+            continue
+        entry_url = entry_urls.get(event_url)
+        if not entry_url:
+            logger.warning("No Entry List link found on %s", event_url)
+            results.append({"trackName": "", "events": [{"title": event_title, "link": event_url}], "racers": []})
+            continue
+        entry_soup = entry_soups.get(entry_url)
+        if entry_soup is None:
+            logger.warning("Skipping event %r (%s): failed to fetch entry list %s", event_title, event_url, entry_url)
+            continue
+        results.append(_event_result(event_title, event_url, entry_url, parse_entry_list(entry_soup)))
+    return results
@@ -1,18 +1,51 @@
 import logging
-from ._common import get_soup, join
-from bs4 import BeautifulSoup
+import re
+from ._common import PARSER, SESSION, clear_page_cache, get_soup, get_soup_if_modified, join
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
 from urllib.parse import urlparse, parse_qs, urlencode
 from datetime import datetime, date
+from scraper_helpers import extract_script_text
 
 logger = logging.getLogger("scrapers.events")
 
+# scrape_events only reads table#events; skip building the rest of the page
+_EVENTS_STRAINER = SoupStrainer("table", id="events")
+
+# selectors used per row, compiled once
+_SEL_HIDDEN_SPAN = sv.compile("span.hidden")
+_SEL_TBODY_TR = sv.compile("tbody tr")
+# YYYY-MM-DD (leading part of the hidden sortable date span) and visible "May 1, 2026" / "March 1, 2026";
+# matched with regexes so common dates never go through exception-driven strptime attempts
+_ISO_PAT = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_MDY_PAT = re.compile(r"([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})")
+_MONTH_NAMES = ("january", "february", "march", "april", "may", "june",
+                "july", "august", "september", "october", "november", "december")
+# full and abbreviated (%B / %b) month names -> month number
+_MONTHS = {k: i for i, n in enumerate(_MONTH_NAMES, 1) for k in (n, n[:3])}
+# ajax: '...' or url: '...' assignments in inline scripts
+_AJAX_PAT = re.compile(r"(ajax|url)\s*[:=]\s*['\"]([^'\"]+)['\"]")
+
+def _ymd(year, month, day):
+    """date from numeric parts, or None if they don't form a valid date."""
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
 def _parse_row_date(td):
     """Parse a date from a table cell (prefer hidden ISO span, fallback to visible text)."""
     if td is None:
         return None
-    span = td.select_one("span.hidden")
+    span = _SEL_HIDDEN_SPAN.select_one(td)
     if span and span.get_text(strip=True):
         txt = span.get_text(strip=True)
+        m = _ISO_PAT.match(txt)
+        if m:
+            d = _ymd(*m.groups())
+            if d:
+                return d
+        # last resort for odd formats
         try:
             return datetime.fromisoformat(txt).date()
         except Exception:
@@ -22,6 +55,18 @@ def _parse_row_date(td):
                 pass
     visible = td.get_text(" ", strip=True)
     if visible:
+        m = _MDY_PAT.fullmatch(visible)
+        if m:
+            month = _MONTHS.get(m.group(1).lower())
+            d = _ymd(m.group(3), month, m.group(2)) if month else None
+            if d:
+                return d
+        m = _ISO_PAT.fullmatch(visible)
+        if m:
+            d = _ymd(*m.groups())
+            if d:
+                return d
+        # last resort for anything the patterns above don't cover
         for fmt in ("%b %d, %Y", "%B %d, %Y", "%Y-%m-%d"):
             try:
                 return datetime.strptime(visible, fmt).date()
@@ -29,12 +74,19 @@ def _parse_row_date(td):
                 continue
     return None
 
-def scrape_events(url, events_since=None, max_pages=1):
+def scrape_events(url, events_since=None, max_pages=1, etag_store=None):
     """
     Extract event links from table#events and filter by events_since (ISO 'YYYY-MM-DD' or date).
     Returns list of {"title","link","date": "YYYY-MM-DD", "snippet": None}.
+    With an etag_store (load_etag_store / save_etag_store) the listing is fetched conditionally:
+    an unchanged page returns [] without being parsed, i.e. nothing new since the run that stored
+    the validators. That only holds if that run's cutoff covers events_since, so an earlier (or no)
+    cutoff refetches unconditionally. Validators are recorded in the store only after the page parsed;
+    persist them with save_etag_store once the returned rows have been processed.
     """
     logger.info("scrape_events: %s (since=%s)", url, events_since)
+    # page bytes are only reused within this run; never serve a listing fetched by an earlier call
+    clear_page_cache()
     # normalize events_since to a date
     since_date = None
     if events_since:
@@ -51,26 +103,34 @@ def scrape_events(url, events_since=None, max_pages=1):
         elif isinstance(events_since, date):
             since_date = events_since
 
-    soup = get_soup(url)
+    since_key = since_date.isoformat() if since_date else None
+    validators = None
+    if etag_store is not None:
+        seen = etag_store.get(url) or {}
+        stored_since = seen.get("since")
+        # a 304 means "nothing beyond what the storing run returned"; a backfill needs the full page
+        if stored_since and (since_key is None or since_key < stored_since):
+            logger.info("scrape_events: since=%s predates stored cutoff %s, fetching %s unconditionally", since_key, stored_since, url)
+            seen = {}
+        soup, validators = get_soup_if_modified(url, seen, parse_only=_EVENTS_STRAINER)
+        if soup is None:
+            logger.info("scrape_events: %s not modified since last run", url)
+            return []
+    else:
+        soup = get_soup(url, parse_only=_EVENTS_STRAINER)
     table = soup.find("table", id="events")
     if not table:
         logger.debug("no table#events found at %s", url)
         return []
 
     items = []
-    for tr in table.select("tbody tr"):
-        # cells: [title, date, # entries, # drivers]
-        tds = tr.find_all("td")
+    for tr in _SEL_TBODY_TR.select(table):
+        # cells: [title, date, # entries, # drivers]; only the first two are used
+        tds = tr.find_all("td", limit=2)
         if not tds:
             continue
-        a = tds[0].find("a") if len(tds) >= 1 else tr.find("a")
-        if not a:
-            continue
-        title = a.get_text(strip=True)
-        href = a.get("href") or ""
-        if not title or not href:
-            continue
 
+        # date filter first so rows outside the window never touch the link cell
         row_date = None
         if len(tds) >= 2:
             row_date = _parse_row_date(tds[1])
@@ -84,6 +144,14 @@ def scrape_events(url, events_since=None, max_pages=1):
                 # cannot determine row date -> skip conservatively
                 continue
 
+        a = tds[0].find("a")
+        if not a:
+            continue
+        title = a.get_text(strip=True)
+        href = a.get("href") or ""
+        if not title or not href:
+            continue
+
         items.append({
             "title": title,
             "link": join(url, href),
@@ -91,19 +159,21 @@ def scrape_events(url, events_since=None, max_pages=1):
             "snippet": None,
         })
 
+    if etag_store is not None:
+        # only now that the page parsed; the caller's save_etag_store commits it
+        if validators:
+            etag_store[url] = dict(validators, since=since_key)
+        else:
+            etag_store.pop(url, None)
+
     logger.info("scrape_events found %d items", len(items))
     return items
 
 def _find_ajax_endpoint(soup):
-    import re
-    for script in soup.find_all("script"):
-        text = script.string or ""
-        m = re.search(r"ajax\s*[:=]\s*['\"]([^'\"]+)['\"]", text)
-        if m:
-            return m.group(1)
-        m = re.search(r"url\s*[:=]\s*['\"]([^'\"]+)['\"]", text)
-        if m and "events" in m.group(1):
-            return m.group(1)
+    # one pass over all inline script text; url: candidates only count if they point at events
+    for m in _AJAX_PAT.finditer(extract_script_text(soup, ("ajax", "url"))):
+        if m.group(1) == "ajax" or "events" in m.group(2):
+            return m.group(2)
     tag = soup.select_one("[data-url], [data-href], [data-src]")
     if tag:
         for attr in ("data-url", "data-href", "data-src"):
@@ -114,8 +184,9 @@ def _find_ajax_endpoint(soup):
 
 def scrape_events_via_ajax(base_url, first_soup=None, max_pages=5):
     logger.info("attempting AJAX-based scraping for %s", base_url)
-    import requests
     if first_soup is None:
+        # standalone call: don't serve the base page from an earlier run
+        clear_page_cache()
         try:
             first_soup = get_soup(base_url)
         except Exception as e:
@@ -138,7 +209,7 @@ def scrape_events_via_ajax(base_url, first_soup=None, max_pages=5):
         q["page"] = [str(p)]
         candidate = parsed._replace(query=urlencode(q, doseq=True)).geturl()
         try:
-            r = requests.get(candidate, timeout=10)
+            r = SESSION.get(candidate, timeout=10)
             r.raise_for_status()
             ct = r.headers.get("content-type", "")
             evs = []
@@ -152,7 +223,7 @@ def scrape_events_via_ajax(base_url, first_soup=None, max_pages=5):
                             text_candidate = v
                             break
                 if text_candidate:
-                    soup = BeautifulSoup(text_candidate, "html.parser")
+                    soup = BeautifulSoup(text_candidate, PARSER)
                     evs = _extract_events_from_soup(soup, base_url)
                 else:
                     if isinstance(data, list):
@@ -163,7 +234,7 @@ def scrape_events_via_ajax(base_url, first_soup=None, max_pages=5):
                                 if title and link:
                                     evs.append({"title": title, "link": join(base_url, link)})
             else:
-                soup = BeautifulSoup(r.text, "html.parser")
+                soup = BeautifulSoup(r.content, PARSER)
                 evs = _extract_events_from_soup(soup, base_url)
             for e in evs:
                 if e["link"] not in seen:
@@ -186,7 +257,7 @@ def _extract_events_from_soup(soup, base_url):
             if href and text:
                 items.append({"title": text, "link": join(base_url, href)})
         return items
-    for tr in table.select("tbody tr"):
+    for tr in _SEL_TBODY_TR.select(table):
         a = tr.find("a")
         if not a:
             continue
@@ -0,0 +1,25 @@
+import unittest
+
+from scraper_helpers import parse_racerlaps_from_js
+
+
+class ParseRacerLapsTest(unittest.TestCase):
+    def test_laps_not_confused_with_prefixed_key(self):
+        js = (
+            "racerLaps[7] = { fastLap: '12.340', prevlaps: [], "
+            "laps: [{lapNum:'1',pos:'2',time:'12.340',pace:'15/5:00'},"
+            "{lapNum:'2',pos:'1',time:'12.500',pace:'15/5:01'}] };"
+        )
+        out = parse_racerlaps_from_js(js)
+        self.assertEqual(out["7"]["lap_stats"]["fastLap"], "12.340")
+        self.assertEqual(
+            out["7"]["laps"],
+            [
+                {"lapNum": "1", "pos": "2", "time": "12.340", "pace": "15/5:00"},
+                {"lapNum": "2", "pos": "1", "time": "12.500", "pace": "15/5:01"},
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
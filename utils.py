@@ -1,40 +1,129 @@
-import json
 import os
+import gzip
+import json
 import logging
+import dataclasses
+from pathlib import Path
+
+# orjson is much faster and emits UTF-8 bytes directly; stdlib json is the fallback
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+# psycopg2 is optional; save_to_db falls back to DB-API executemany without it
+try:
+	from psycopg2.extras import execute_values
+except ImportError:
+	execute_values = None
 
 logger = logging.getLogger("utils")
 
+# output locations, resolved once; the local dir is created on first use (never on Lambda,
+# where the working dir is read-only)
+_TMP_DIR = Path("/tmp")
+_LOCAL_DIR = Path.cwd() / "scrape_results"
+_local_dir_ready = False
+
+def _json_default(obj):
+	"""stdlib json hook for dataclass rows (e.g. TrackRow, Racer), which orjson handles natively."""
+	if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+		return dataclasses.asdict(obj)
+	raise TypeError("Object of type %s is not JSON serializable" % type(obj).__name__)
+
+def _dumps(data, pretty=False):
+	"""Serialize data to UTF-8 JSON bytes, compact unless pretty. Raises TypeError if unserializable."""
+	if orjson is not None:
+		option = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+		if pretty:
+			option |= orjson.OPT_INDENT_2
+		return orjson.dumps(data, option=option)
+	if pretty:
+		return json.dumps(data, ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+	return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode("utf-8")
+
 def save_json_to_tmp(data, filename):
 	"""
-	Write JSON to /tmp and also store a copy under ./scrape_results for local inspection.
-	Return the /tmp path (primary for Lambda).
+	Write compact, gzipped JSON to /tmp/<filename>.gz and, when not running on Lambda, also
+	store a pretty-printed copy under ./scrape_results for local inspection.
+	Return the /tmp .gz path (primary for Lambda; upload with ContentEncoding: gzip), or None if
+	it could not be serialized or written.
 	"""
+	global _local_dir_ready
 	# ensure /tmp write (Lambda) and local copy
-	tmp_path = os.path.join("/tmp", filename)
+	tmp_path = str(_TMP_DIR / (filename + ".gz"))
 	try:
-		with open(tmp_path, "w", encoding="utf-8") as f:
-			json.dump(data, f, ensure_ascii=False, indent=2)
-		logger.info("Wrote JSON to %s", tmp_path)
+		payload = _dumps(data)
+	except (TypeError, ValueError) as e:
+		logger.exception("Failed to serialize JSON for %s: %s", filename, e)
+		return None
+
+	try:
+		with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+			f.write(payload)
+		logger.info("Wrote gzipped JSON to %s", tmp_path)
 	except Exception as e:
 		logger.exception("Failed to write JSON to /tmp: %s", e)
+		tmp_path = None
 
-	# also save a local copy for debugging when running locally
-	local_dir = os.path.join(os.getcwd(), "scrape_results")
+	# also save a readable local copy for debugging when running locally; on Lambda the
+	# working dir is read-only and nobody reads it, so skip the second (pretty) serialization
+	if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+		return tmp_path
 	try:
-		os.makedirs(local_dir, exist_ok=True)
-		local_path = os.path.join(local_dir, filename)
-		with open(local_path, "w", encoding="utf-8") as f:
-			json.dump(data, f, ensure_ascii=False, indent=2)
+		if not _local_dir_ready:
+			_LOCAL_DIR.mkdir(exist_ok=True)
+			_local_dir_ready = True
+		local_path = _LOCAL_DIR / filename
+		local_path.write_bytes(_dumps(data, pretty=True))
 		logger.info("Wrote local JSON copy to %s", local_path)
 	except Exception as e:
 		logger.exception("Failed to write local JSON copy: %s", e)
 
 	return tmp_path
 
-def save_to_db(data):
+def _racer_row(event_link, r):
+	"""racers row from a result racer: a { name, transponder, class } dict (incl. reloaded JSON) or a Racer."""
+	if isinstance(r, dict):
+		return (event_link, r.get("name"), r.get("transponder"), r.get("class"))
+	return (event_link, r.name, r.transponder, r.cls)
+
+def save_to_db(data, conn=None):
 	"""
-	Placeholder for DB persistence. Implement your DB logic here.
-	Currently returns False to indicate no DB write performed.
+	Persist scrape_event_entries results (one result dict or a list of them) to
+	races(event_title, link) and racers(event_link, name, transponder, class).
+
+	`conn` is an open DB-API connection using the %s paramstyle (psycopg2). Without one
+	nothing is written and False is returned. Both tables are written as batches in a
+	single transaction (execute_values when psycopg2 is installed, executemany otherwise);
+	never insert row by row.
 	"""
-	# ...existing code...
-	return False
\ No newline at end of file
+	if conn is None:
+		return False
+	results = data if isinstance(data, list) else [data]
+
+	race_rows = []
+	racer_rows = []
+	for res in results:
+		events = res.get("events") or []
+		for ev in events:
+			race_rows.append((ev.get("title"), ev.get("link")))
+		event_link = events[0].get("link") if events else None
+		racer_rows.extend(_racer_row(event_link, r) for r in res.get("racers", ()))
+
+	cur = conn.cursor()
+	try:
+		if execute_values is not None:
+			execute_values(cur, "INSERT INTO races (event_title, link) VALUES %s", race_rows, page_size=1000)
+			execute_values(cur, "INSERT INTO racers (event_link, name, transponder, class) VALUES %s", racer_rows, page_size=1000)
+		else:
+			cur.executemany("INSERT INTO races (event_title, link) VALUES (%s, %s)", race_rows)
+			cur.executemany("INSERT INTO racers (event_link, name, transponder, class) VALUES (%s, %s, %s, %s)", racer_rows)
+		conn.commit()
+	except Exception:
+		conn.rollback()
+		raise
+	finally:
+		cur.close()
+	logger.info("Saved %d races and %d racers to DB", len(race_rows), len(racer_rows))
+	return True